@@ -9,7 +9,6 @@ __version__ = "1.0.0"
 __author__ = "Dang Linh Anh"
 __license__ = "MIT"
 
-from .capturer import ScreenshotCapturer, CaptureMode
 from .exceptions import (
     ScreenshotCapturerError,
     PlatformNotSupportedError,
@@ -19,7 +18,40 @@ from .exceptions import (
 __all__ = [
     "ScreenshotCapturer",
     "CaptureMode",
+    "Region",
     "ScreenshotCapturerError",
     "PlatformNotSupportedError",
     "CaptureFailedError",
 ]
+
+# The capturer module pulls in Pillow and the capture backends, so it is only
+# imported when one of its names is first accessed. This keeps CLI paths such
+# as --help and --show-config from paying that import cost.
+_LAZY_ATTRIBUTES = {
+    "ScreenshotCapturer": "capturer",
+    "CaptureMode": "capturer_types",
+    "Region": "capturer_types",
+}
+
+# Type checkers resolve the lazy names statically (they treat TYPE_CHECKING as
+# true); at runtime the imports are skipped without importing typing
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .capturer import ScreenshotCapturer
+    from .capturer_types import CaptureMode, Region
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> "list[str]":
+    return sorted(set(globals()) | set(__all__))
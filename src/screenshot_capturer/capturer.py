@@ -2,20 +2,43 @@
 Core screenshot capture functionality.
 """
 
+from __future__ import annotations
+
+import concurrent.futures
+import contextlib
+import functools
 import io
 import platform
 import sys
-from dataclasses import dataclass
-from enum import Enum
+import threading
+import time
 from pathlib import Path
-from typing import Optional, Tuple, Union
+from types import TracebackType
+from typing import Any, Dict, Iterator, Optional, Set, Tuple, Union
 
 try:
     from PIL import Image, ImageGrab
 except ImportError:
-    Image = None
-    ImageGrab = None
+    Image = None  # type: ignore[assignment,unused-ignore]
+    ImageGrab = None  # type: ignore[assignment,unused-ignore]
+
+try:
+    import mss
+    from mss.exception import ScreenShotError
+except ImportError:
+    mss = None  # type: ignore[assignment,unused-ignore]
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment,unused-ignore]
+
+try:
+    import turbojpeg
+except ImportError:
+    turbojpeg = None  # type: ignore[assignment,unused-ignore]
 
+from .capturer_types import CaptureMode, Region
 from .exceptions import (
     CaptureFailedError,
     InvalidRegionError,
@@ -23,39 +46,40 @@ from .exceptions import (
     SaveError,
 )
 
+# CaptureMode and Region are re-exported so existing
+# ``from .capturer import Region`` imports keep working
+__all__ = ["ScreenshotCapturer", "CaptureMode", "Region"]
 
-class CaptureMode(Enum):
-    """Available screenshot capture modes."""
+# Pillow's encoders emit many small chunks; a large write buffer turns them
+# into a few big writes, which matters most on Windows.
+_WRITE_BUFFER_SIZE = 1 << 20
 
-    FULLSCREEN = "fullscreen"
-    ACTIVE_WINDOW = "active_window"
-    REGION = "region"
+# Spellings Pillow does not register as encoder names
+_FORMAT_ALIASES = {"JPG": "JPEG"}
 
+# Fixed Pillow save options per normalised format; per-call options (JPEG
+# quality, PNG compress level) are added in _resolve_format()
+_FORMAT_KWARGS: Dict[str, Dict[str, Any]] = {
+    "PNG": {"optimize": False},
+    "JPEG": {"optimize": True},
+    # For lossless WebP, libwebp reads quality as compression effort; its
+    # default of 80 encodes ~3x slower than quality=0 on screen content
+    "WEBP": {"lossless": True, "quality": 0},
+}
 
-@dataclass
-class Region:
-    """Represents a rectangular region for screenshot capture."""
+# Image modes the JPEG encoder cannot write, and the mode to convert them to
+_JPEG_MODE_CONVERSIONS = {"RGBA": "RGB", "LA": "L", "P": "RGB"}
 
-    x: int
-    y: int
-    width: int
-    height: int
+# DwmGetWindowAttribute attribute holding the visible window frame
+_DWMWA_EXTENDED_FRAME_BOUNDS = 9
 
-    def __post_init__(self):
-        """Validate region dimensions."""
-        if self.width <= 0 or self.height <= 0:
-            raise InvalidRegionError(
-                f"Region dimensions must be positive (got width={self.width}, height={self.height})"
-            )
-        if self.x < 0 or self.y < 0:
-            raise InvalidRegionError(
-                f"Region coordinates must be non-negative (got x={self.x}, y={self.y})"
-            )
 
-    @property
-    def bbox(self) -> Tuple[int, int, int, int]:
-        """Return bounding box tuple (x1, y1, x2, y2) for PIL."""
-        return (self.x, self.y, self.x + self.width, self.y + self.height)
+@functools.lru_cache(maxsize=1)
+def _default_bytes_format() -> str:
+    """Return WEBP if this Pillow build can encode it, otherwise PNG."""
+    from PIL import features
+
+    return "WEBP" if features.check_module("webp") else "PNG"
 
 
 class ScreenshotCapturer:
@@ -70,22 +94,194 @@ class ScreenshotCapturer:
     - Save to file or get as bytes
     """
 
-    def __init__(self):
-        """Initialize the screenshot capturer."""
+    __slots__ = (
+        "_png_compress_level",
+        "_webp_method",
+        "_sct",
+        "_sct_unavailable",
+        "_tj",
+        "_tj_unavailable",
+        "_scratch",
+        "_known_dirs",
+        "_io_pool",
+        "_platform",
+        "_grab_bounds",
+    )
+
+    _SUPPORTED_PLATFORMS = frozenset({"Windows", "Linux", "Darwin"})
+    _SUPPORTED_FORMATS = ("PNG", "JPEG", "JPG", "BMP", "GIF", "TIFF", "WebP")
+
+    def __init__(
+        self,
+        png_compress_level: int = 1,
+        use_turbojpeg: bool = True,
+        webp_method: int = 0,
+    ):
+        """
+        Initialize the screenshot capturer.
+
+        Args:
+            png_compress_level: zlib compression level (0-9) used for PNG output.
+                PNG encoding dominates save time for large screenshots, so the
+                default of 1 favours speed at a small file-size cost; use 6
+                (Pillow's default) for smaller files.
+            use_turbojpeg: Encode RGB JPEG output with libjpeg-turbo through
+                PyTurboJPEG when it is installed. Falls back to Pillow otherwise.
+            webp_method: libwebp effort (0-6) for lossless WebP output, the
+                WebP analog of png_compress_level: 0 is fastest, 6 smallest.
+
+        Raises:
+            ValueError: If png_compress_level is outside 0-9 or webp_method
+                is outside 0-6
+        """
+        if not 0 <= png_compress_level <= 9:
+            raise ValueError("PNG compress level must be between 0 and 9")
+        if not 0 <= webp_method <= 6:
+            raise ValueError("WebP method must be between 0 and 6")
+
         self._check_dependencies()
+        self._png_compress_level = png_compress_level
+        self._webp_method = webp_method
+        # The mss handle is opened on first capture and reused afterwards,
+        # since creating one is far more expensive than a single grab.
+        self._sct: Optional[Any] = None
+        self._sct_unavailable = mss is None
+        # (x, y, width, height) of a fullscreen ImageGrab capture, learned from
+        # the first one; mss reports its bounds directly
+        self._grab_bounds: Optional[Tuple[int, int, int, int]] = None
+        # Likewise the TurboJPEG handle, which loads libturbojpeg on creation
+        self._tj: Optional[Any] = None
+        self._tj_unavailable = not use_turbojpeg or turbojpeg is None or np is None
+        # Per-thread scratch buffer reused by get_screenshot_bytes()
+        self._scratch = threading.local()
+        # Output directories already created, so repeated saves into the same
+        # directory skip the mkdir syscall
+        self._known_dirs: Set[Path] = set()
+        # Background pool for save_screenshot_async(), created on first use
+        self._io_pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
         self._platform = platform.system()
-        self._supported_platforms = ["Windows", "Linux", "Darwin"]
 
-        if self._platform not in self._supported_platforms:
+        if self._platform not in self._SUPPORTED_PLATFORMS:
             raise PlatformNotSupportedError(self._platform)
 
-    def _check_dependencies(self):
+    def _check_dependencies(self) -> None:
         """Check if required dependencies are available."""
         if Image is None or ImageGrab is None:
             raise ImportError(
                 "Pillow library is required. Install it with: pip install Pillow"
             )
 
+    def _get_sct(self) -> Optional[Any]:
+        """Return the shared mss handle, or None if mss cannot be used."""
+        if self._sct is None and not self._sct_unavailable:
+            try:
+                # mss 10 renamed the factory to MSS and deprecated mss()
+                self._sct = getattr(mss, "MSS", mss.mss)()
+            except (ScreenShotError, OSError):
+                # e.g. no X display; fall back to ImageGrab from now on
+                self._sct_unavailable = True
+        return self._sct
+
+    def _resolve_format(self, format: str, quality: int) -> Tuple[str, Dict[str, Any]]:
+        """
+        Normalise a format name and build its Pillow save options.
+
+        Args:
+            format: Image format name, in any case
+            quality: JPEG quality (1-100), only used for JPEG format
+
+        Returns:
+            Tuple of the Pillow format name and the keyword arguments for save()
+        """
+        format = format.upper()
+        format = _FORMAT_ALIASES.get(format, format)
+        save_kwargs = dict(_FORMAT_KWARGS.get(format, ()))
+        if format == "JPEG":
+            save_kwargs["quality"] = quality
+        elif format == "PNG":
+            save_kwargs["compress_level"] = self._png_compress_level
+        elif format == "WEBP":
+            save_kwargs["method"] = self._webp_method
+        return format, save_kwargs
+
+    @staticmethod
+    def _prepare_jpeg(screenshot: Image.Image) -> Image.Image:
+        """
+        Drop alpha/palette information the JPEG encoder cannot write.
+
+        Converting explicitly makes RGBA captures save as JPEG instead of
+        failing, and lets them take the TurboJPEG path.
+        """
+        mode = _JPEG_MODE_CONVERSIONS.get(screenshot.mode)
+        if mode is None:
+            return screenshot
+        return screenshot.convert(mode)
+
+    def _encode_jpeg_turbo(
+        self, screenshot: Image.Image, quality: int
+    ) -> Optional[bytes]:
+        """
+        Encode an RGB screenshot to JPEG with libjpeg-turbo.
+
+        Returns:
+            bytes or None: Encoded JPEG data, or None if TurboJPEG is not
+            available or cannot handle the image mode
+        """
+        if self._tj_unavailable or screenshot.mode != "RGB":
+            return None
+        if self._tj is None:
+            try:
+                self._tj = turbojpeg.TurboJPEG()
+            except Exception:
+                # PyTurboJPEG is installed but libturbojpeg could not be loaded
+                self._tj_unavailable = True
+                return None
+        data: bytes = self._tj.encode(
+            np.asarray(screenshot),
+            quality=quality,
+            pixel_format=turbojpeg.TJPF_RGB,
+            jpeg_subsample=turbojpeg.TJSAMP_420,
+        )
+        return data
+
+    def _fullscreen_bounds(self) -> Optional[Tuple[int, int, int, int]]:
+        """Return (x, y, width, height) of a fullscreen capture, if known."""
+        sct = self._get_sct()
+        if sct is None:
+            return self._grab_bounds
+        monitor = sct.monitors[0]
+        return (monitor["left"], monitor["top"], monitor["width"], monitor["height"])
+
+    def _grab(self, region: Optional[Region] = None) -> Image.Image:
+        """
+        Grab screen pixels, preferring mss over PIL.ImageGrab.
+
+        Args:
+            region: Area to grab, or None for the whole screen
+
+        Returns:
+            PIL.Image.Image: The grabbed pixels
+        """
+        sct = self._get_sct()
+        if sct is None:
+            if region is None:
+                screenshot = ImageGrab.grab()
+                self._grab_bounds = (0, 0) + screenshot.size
+                return screenshot
+            return ImageGrab.grab(bbox=region.bbox)
+
+        if region is None:
+            monitor = sct.monitors[0]
+        else:
+            monitor = {
+                "left": region.x,
+                "top": region.y,
+                "width": region.width,
+                "height": region.height,
+            }
+        raw = sct.grab(monitor)
+        return Image.frombytes("RGB", raw.size, raw.raw, "raw", "BGRX")
+
     def capture_fullscreen(self) -> Image.Image:
         """
         Capture the entire screen.
@@ -97,13 +293,89 @@ class ScreenshotCapturer:
             CaptureFailedError: If the capture operation fails
         """
         try:
-            screenshot = ImageGrab.grab()
+            screenshot = self._grab()
             if screenshot is None:
                 raise CaptureFailedError("Screenshot capture returned None")
             return screenshot
         except Exception as e:
             raise CaptureFailedError(f"Failed to capture fullscreen: {str(e)}")
 
+    def capture_fullscreen_np(self) -> "np.ndarray":
+        """
+        Capture the entire screen as a NumPy array.
+
+        With mss available the array is a view over the grabbed BGRA buffer,
+        so no PIL image is built and no pixel copy is made. Use save_array()
+        to write the result to disk.
+
+        Returns:
+            numpy.ndarray: uint8 array of shape (height, width, 4) in BGRA order
+
+        Raises:
+            ImportError: If NumPy is not installed
+            CaptureFailedError: If the capture operation fails
+        """
+        if np is None:
+            raise ImportError(
+                "NumPy is required for array capture. Install it with: pip install numpy"
+            )
+
+        try:
+            sct = self._get_sct()
+            if sct is None:
+                screenshot = ImageGrab.grab()
+                width, height = screenshot.size
+                data = screenshot.convert("RGBA").tobytes("raw", "BGRA")
+            else:
+                raw = sct.grab(sct.monitors[0])
+                width, height = raw.size
+                data = raw.raw
+        except Exception as e:
+            raise CaptureFailedError(f"Failed to capture fullscreen: {str(e)}")
+
+        return np.frombuffer(data, dtype=np.uint8).reshape(height, width, 4)
+
+    def capture_stream(
+        self, fps: float, count: Optional[int] = None
+    ) -> Iterator["np.ndarray"]:
+        """
+        Capture fullscreen frames at a steady rate.
+
+        Each frame is yielded as captured by capture_fullscreen_np(): a view
+        over that grab's own buffer, with no extra copy. Frames are
+        independent, so they stay valid for as long as they are referenced.
+
+        Args:
+            fps: Target frames per second
+            count: Number of frames to capture, or None to stream until the
+                generator is closed
+
+        Yields:
+            numpy.ndarray: uint8 array of shape (height, width, 4) in BGRA order
+
+        Raises:
+            ValueError: If fps is not positive
+            ImportError: If NumPy is not installed
+            CaptureFailedError: If a capture fails
+        """
+        if fps <= 0:
+            raise ValueError("fps must be positive")
+
+        interval = 1.0 / fps
+        index = 0
+        next_frame = time.perf_counter()
+        while count is None or index < count:
+            yield self.capture_fullscreen_np()
+
+            index += 1
+            next_frame += interval
+            delay = next_frame - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # Running behind; don't try to catch up with a burst of frames
+                next_frame = time.perf_counter()
+
     def capture_region(self, region: Region) -> Image.Image:
         """
         Capture a specific region of the screen.
@@ -119,7 +391,13 @@ class ScreenshotCapturer:
             InvalidRegionError: If the region is invalid
         """
         try:
-            screenshot = ImageGrab.grab(bbox=region.bbox)
+            # A region covering the whole screen takes the fullscreen path,
+            # which skips bounding-box clipping
+            bounds = (region.x, region.y, region.width, region.height)
+            if bounds == self._fullscreen_bounds():
+                screenshot = self._grab()
+            else:
+                screenshot = self._grab(region)
             if screenshot is None:
                 raise CaptureFailedError("Screenshot capture returned None")
             return screenshot
@@ -128,6 +406,70 @@ class ScreenshotCapturer:
         except Exception as e:
             raise CaptureFailedError(f"Failed to capture region: {str(e)}")
 
+    def _active_window_region(self) -> Optional[Region]:
+        """
+        Locate the foreground window on screen.
+
+        Returns:
+            Region: The window's on-screen rectangle, clipped to non-negative
+            coordinates, or None if it cannot be determined on this platform
+        """
+        if self._platform == "Windows":
+            import ctypes
+            from ctypes import wintypes
+
+            # Opening the mss handle makes the process DPI aware; it has to
+            # happen before the rectangle is read or it comes back scaled
+            self._get_sct()
+            # windll only exists on Windows builds of ctypes
+            windll = getattr(ctypes, "windll")
+            hwnd = windll.user32.GetForegroundWindow()
+            if not hwnd:
+                return None
+            rect = wintypes.RECT()
+            # GetWindowRect includes the invisible resize borders on Windows
+            # 10+; the DWM frame bounds are what is actually drawn
+            try:
+                found = not windll.dwmapi.DwmGetWindowAttribute(
+                    hwnd,
+                    _DWMWA_EXTENDED_FRAME_BOUNDS,
+                    ctypes.byref(rect),
+                    ctypes.sizeof(rect),
+                )
+            except OSError:
+                found = False
+            if not found and not windll.user32.GetWindowRect(hwnd, ctypes.byref(rect)):
+                return None
+            left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
+        elif self._platform == "Darwin":
+            try:
+                import Quartz
+            except ImportError:
+                return None
+
+            windows = Quartz.CGWindowListCopyWindowInfo(
+                Quartz.kCGWindowListOptionOnScreenOnly
+                | Quartz.kCGWindowListExcludeDesktopElements,
+                Quartz.kCGNullWindowID,
+            )
+            # Windows are listed front to back; layer 0 holds normal app windows
+            bounds = next(
+                (w["kCGWindowBounds"] for w in windows if w["kCGWindowLayer"] == 0),
+                None,
+            )
+            if bounds is None:
+                return None
+            left, top = int(bounds["X"]), int(bounds["Y"])
+            right, bottom = left + int(bounds["Width"]), top + int(bounds["Height"])
+        else:
+            return None
+
+        # Maximised windows can extend a few pixels past the screen edge
+        left, top = max(left, 0), max(top, 0)
+        if right <= left or bottom <= top:
+            return None
+        return Region(x=left, y=top, width=right - left, height=bottom - top)
+
     def capture_active_window(self) -> Image.Image:
         """
         Capture the currently active window.
@@ -151,9 +493,9 @@ class ScreenshotCapturer:
             )
 
         try:
-            # On Windows, ImageGrab.grab() with all_screens=False captures the primary monitor
-            # For active window, we'd need platform-specific code
-            screenshot = ImageGrab.grab()
+            # Grab only the window's rectangle; if it cannot be determined
+            # (e.g. Quartz bindings missing on macOS), capture the whole screen
+            screenshot = self._grab(self._active_window_region())
             if screenshot is None:
                 raise CaptureFailedError("Screenshot capture returned None")
             return screenshot
@@ -176,6 +518,11 @@ class ScreenshotCapturer:
             format: Image format (PNG, JPEG, BMP, etc.). Auto-detected from filename if None
             quality: JPEG quality (1-100), only used for JPEG format
 
+        PNG output uses the capturer's ``png_compress_level`` with Pillow's
+        ``optimize`` pass disabled, trading a slightly larger file for a much
+        faster encode. WebP output is lossless, encoded at the lowest effort
+        (``quality=0``) with ``webp_method``.
+
         Returns:
             Path: Absolute path to the saved file
 
@@ -186,37 +533,149 @@ class ScreenshotCapturer:
 
         try:
             # Create parent directories if they don't exist
-            filepath.parent.mkdir(parents=True, exist_ok=True)
+            parent = filepath.parent
+            if parent not in self._known_dirs:
+                parent.mkdir(parents=True, exist_ok=True)
+                self._known_dirs.add(parent)
 
             # Determine format
             if format is None:
-                format = filepath.suffix.lstrip(".").upper()
+                format = filepath.suffix.lstrip(".")
                 if not format:
                     format = "PNG"
 
             # Save with appropriate settings
-            save_kwargs = {}
-            if format.upper() in ["JPEG", "JPG"]:
-                save_kwargs["quality"] = quality
-                save_kwargs["optimize"] = True
-
-            screenshot.save(filepath, format=format, **save_kwargs)
+            format, save_kwargs = self._resolve_format(format, quality)
+
+            data = None
+            if format == "JPEG":
+                screenshot = self._prepare_jpeg(screenshot)
+                data = self._encode_jpeg_turbo(screenshot, quality)
+            elif format not in Image.SAVE:
+                # Reject unknown formats before the output file is created
+                Image.init()
+                if format not in Image.SAVE:
+                    raise ValueError(f"unknown file format {format!r}")
+
+            try:
+                fh = open(filepath, "wb", buffering=_WRITE_BUFFER_SIZE)
+            except FileNotFoundError:
+                # The directory was removed after it was cached; recreate it
+                parent.mkdir(parents=True, exist_ok=True)
+                fh = open(filepath, "wb", buffering=_WRITE_BUFFER_SIZE)
+
+            try:
+                with fh:
+                    if data is not None:
+                        fh.write(data)
+                    else:
+                        screenshot.save(fh, format=format, **save_kwargs)
+            except BaseException:
+                # Pillow removes a file it opened itself when encoding fails;
+                # do the same so a failed save leaves nothing behind
+                with contextlib.suppress(OSError):
+                    filepath.unlink()
+                raise
             return filepath.absolute()
 
         except Exception as e:
             raise SaveError(f"Failed to save screenshot to {filepath}: {str(e)}")
 
+    def save_array(
+        self,
+        array: "np.ndarray",
+        filepath: Union[str, Path],
+        format: Optional[str] = None,
+        quality: int = 95,
+    ) -> Path:
+        """
+        Save a BGRA array, as returned by capture_fullscreen_np(), to a file.
+
+        The array is handed to Pillow with Image.frombuffer, which decodes the
+        BGRA pixels directly instead of going through an intermediate copy.
+        The alpha channel is dropped.
+
+        Args:
+            array: uint8 array of shape (height, width, 4) in BGRA order
+            filepath: Path where the screenshot should be saved
+            format: Image format (PNG, JPEG, BMP, etc.). Auto-detected from filename if None
+            quality: JPEG quality (1-100), only used for JPEG format
+
+        Returns:
+            Path: Absolute path to the saved file
+
+        Raises:
+            ValueError: If the array does not have a BGRA uint8 layout
+            SaveError: If saving fails
+        """
+        if array.ndim != 3 or array.shape[2] != 4 or array.dtype != np.uint8:
+            raise ValueError(
+                f"Expected a (height, width, 4) uint8 BGRA array (got shape="
+                f"{array.shape}, dtype={array.dtype})"
+            )
+
+        height, width = array.shape[:2]
+        screenshot = Image.frombuffer(
+            "RGB", (width, height), np.ascontiguousarray(array), "raw", "BGRX", 0, 1
+        )
+        return self.save_screenshot(screenshot, filepath, format, quality)
+
+    def save_screenshot_async(
+        self,
+        screenshot: Image.Image,
+        filepath: Union[str, Path],
+        format: Optional[str] = None,
+        quality: int = 95,
+    ) -> "concurrent.futures.Future[Path]":
+        """
+        Save a screenshot to a file on a background thread.
+
+        Pillow releases the GIL while encoding, so the next capture can start
+        while the previous one is still being written. The screenshot must not
+        be modified until the returned future completes. Callers should wait on
+        their futures (or use the capturer as a context manager, which waits on
+        exit) before the program ends.
+
+        Args:
+            screenshot: PIL Image object to save
+            filepath: Path where the screenshot should be saved
+            format: Image format (PNG, JPEG, BMP, etc.). Auto-detected from filename if None
+            quality: JPEG quality (1-100), only used for JPEG format
+
+        Returns:
+            concurrent.futures.Future: Resolves to the absolute path of the saved
+            file, or raises SaveError
+        """
+        if self._io_pool is None:
+            self._io_pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="screenshot-save"
+            )
+        return self._io_pool.submit(
+            self.save_screenshot, screenshot, filepath, format, quality
+        )
+
     def get_screenshot_bytes(
-        self, screenshot: Image.Image, format: str = "PNG", quality: int = 95
+        self,
+        screenshot: Image.Image,
+        format: Optional[str] = None,
+        quality: int = 95,
     ) -> bytes:
         """
         Get screenshot as bytes.
 
         Args:
             screenshot: PIL Image object
-            format: Image format (PNG, JPEG, BMP, etc.)
+            format: Image format (PNG, JPEG, BMP, etc.). Defaults to lossless
+                WebP at its lowest effort, which typically encodes faster than
+                PNG at compress_level 1 and produces a smaller result on
+                screen content; falls back to PNG if Pillow lacks WebP support
             quality: JPEG quality (1-100), only used for JPEG format
 
+        PNG and WebP output use the same fast compression settings as
+        save_screenshot(). Encoding goes through a per-thread scratch buffer
+        that keeps its allocation between calls, so repeated conversions do
+        not regrow a multi-megabyte buffer each time.
+
         Returns:
             bytes: Screenshot as bytes
 
@@ -224,14 +683,26 @@ class ScreenshotCapturer:
             SaveError: If conversion fails
         """
         try:
-            buffer = io.BytesIO()
-            save_kwargs = {}
-            if format.upper() in ["JPEG", "JPG"]:
-                save_kwargs["quality"] = quality
-                save_kwargs["optimize"] = True
+            if format is None:
+                format = _default_bytes_format()
+            format, save_kwargs = self._resolve_format(format, quality)
+
+            if format == "JPEG":
+                screenshot = self._prepare_jpeg(screenshot)
+                data = self._encode_jpeg_turbo(screenshot, quality)
+                if data is not None:
+                    return data
+
+            buffer = getattr(self._scratch, "buffer", None)
+            if buffer is None:
+                buffer = self._scratch.buffer = io.BytesIO()
+            # Overwrite in place rather than truncating, which would release
+            # the allocation; only the bytes written by this call are returned.
+            buffer.seek(0)
 
             screenshot.save(buffer, format=format, **save_kwargs)
-            return buffer.getvalue()
+            with buffer.getbuffer() as view:
+                return bytes(view[: buffer.tell()])
         except Exception as e:
             raise SaveError(f"Failed to convert screenshot to bytes: {str(e)}")
 
@@ -250,7 +721,10 @@ class ScreenshotCapturer:
             filepath: Where to save (if None, returns PIL Image)
             mode: Capture mode to use
             region: Region to capture (required if mode is REGION)
-            format: Image format
+            format: Image format. For throughput-sensitive intermediate
+                captures that are converted later in bulk, use "BMP": it is
+                written without filtering or compression (roughly 20x faster
+                than PNG for a 4K frame) at a much larger file size
             quality: JPEG quality (1-100)
 
         Returns:
@@ -277,12 +751,38 @@ class ScreenshotCapturer:
         else:
             return screenshot
 
+    def close(self) -> None:
+        """
+        Release capture resources.
+
+        Waits for pending background saves to finish, then closes the mss
+        handle. The capturer can still be used afterwards; resources are
+        reopened on demand.
+        """
+        if self._io_pool is not None:
+            self._io_pool.shutdown(wait=True)
+            self._io_pool = None
+        if self._sct is not None:
+            self._sct.close()
+            self._sct = None
+
+    def __enter__(self) -> "ScreenshotCapturer":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
     @property
     def platform(self) -> str:
         """Get the current platform name."""
         return self._platform
 
     @property
-    def supported_formats(self) -> list:
-        """Get list of supported image formats."""
-        return ["PNG", "JPEG", "JPG", "BMP", "GIF", "TIFF", "WebP"]
+    def supported_formats(self) -> Tuple[str, ...]:
+        """Get the supported image formats."""
+        return self._SUPPORTED_FORMATS
@@ -0,0 +1,54 @@
+"""
+Lightweight value types shared by the capturer and the CLI.
+
+This module has no dependency on Pillow or the capture backends, so it can
+be imported on paths that never capture.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from enum import Enum
+
+from .exceptions import InvalidRegionError
+
+__all__ = ["CaptureMode", "Region"]
+
+
+class CaptureMode(Enum):
+    """Available screenshot capture modes."""
+
+    FULLSCREEN = "fullscreen"
+    ACTIVE_WINDOW = "active_window"
+    REGION = "region"
+
+
+@dataclass(frozen=True)
+class Region:
+    """
+    Represents a rectangular region for screenshot capture.
+
+    Regions are immutable; ``bbox`` is computed once at construction so the
+    capture path does not rebuild it on every access.
+    """
+
+    x: int
+    y: int
+    width: int
+    height: int
+    bbox: tuple[int, int, int, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Validate region dimensions."""
+        if self.width <= 0 or self.height <= 0:
+            raise InvalidRegionError(
+                f"Region dimensions must be positive (got width={self.width}, height={self.height})"
+            )
+        if self.x < 0 or self.y < 0:
+            raise InvalidRegionError(
+                f"Region coordinates must be non-negative (got x={self.x}, y={self.y})"
+            )
+        # Bounding box tuple (x1, y1, x2, y2) for PIL
+        object.__setattr__(
+            self, "bbox", (self.x, self.y, self.x + self.width, self.y + self.height)
+        )
@@ -2,16 +2,71 @@
 Command-line interface for the screenshot capturer.
 """
 
+from __future__ import annotations
+
 import argparse
+import re
 import sys
-from datetime import datetime
+import time
 from pathlib import Path
-from typing import Optional
 
 from . import __version__
-from .capturer import CaptureMode, Region, ScreenshotCapturer
+from .capturer_types import CaptureMode, Region
 from .config import Config
-from .exceptions import ScreenshotCapturerError
+from .exceptions import InvalidRegionError, ScreenshotCapturerError
+
+__all__ = [
+    "create_parser",
+    "generate_filename",
+    "handle_config_display",
+    "handle_config_update",
+    "main",
+    "parse_region",
+]
+
+# The capturer module (and with it Pillow and the capture backends) is
+# imported only on paths that capture, keeping --help, --version and the
+# config commands fast.
+
+# x,y,width,height; signs are accepted so Region can report negative values
+_REGION_RE = re.compile(r"\s*(-?\d+)\s*,\s*(-?\d+)\s*,\s*(-?\d+)\s*,\s*(-?\d+)\s*")
+
+_FORMAT_CHOICES = ("png", "jpeg", "jpg", "bmp", "gif", "tiff", "webp")
+_MODE_CHOICES = ("fullscreen", "region", "active_window")
+
+# Parsed arguments for a bare invocation; must match create_parser()'s defaults
+_DEFAULT_ARGS = {
+    "mode": "fullscreen",
+    "region": None,
+    "output": None,
+    "format": "png",
+    "quality": 95,
+    "show_config": False,
+    "set_default_format": None,
+    "set_default_dir": None,
+    "verbose": False,
+    "quiet": False,
+}
+
+_EPILOG = """
+Examples:
+  # Capture full screen to default location
+  screenshot-capturer
+
+  # Capture to specific file
+  screenshot-capturer -o ~/Pictures/my_screenshot.png
+
+  # Capture a region (x, y, width, height)
+  screenshot-capturer -m region -r 100,100,800,600
+
+  # Capture as JPEG with custom quality
+  screenshot-capturer -f jpeg -q 85
+
+  # Show current configuration
+  screenshot-capturer --show-config
+
+For more information, visit: https://github.com/codeforgood-org/desktop-screenshot-capturer
+"""
 
 
 def generate_filename(format: str = "PNG") -> str:
@@ -24,7 +79,7 @@ def generate_filename(format: str = "PNG") -> str:
     Returns:
         str: Generated filename
     """
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
     return f"screenshot_{timestamp}.{format.lower()}"
 
 
@@ -41,47 +96,40 @@ def parse_region(region_str: str) -> Region:
     Raises:
         ValueError: If the region string is invalid
     """
-    try:
-        parts = region_str.split(",")
-        if len(parts) != 4:
-            raise ValueError("Region must have 4 values: x,y,width,height")
+    match = _REGION_RE.fullmatch(region_str)
+    if match is None:
+        raise ValueError(
+            "Invalid region format: Region must have 4 integer values: x,y,width,height"
+        )
 
-        x, y, width, height = map(int, parts)
-        return Region(x=x, y=y, width=width, height=height)
-    except Exception as e:
+    try:
+        return Region(
+            x=int(match[1]), y=int(match[2]), width=int(match[3]), height=int(match[4])
+        )
+    except InvalidRegionError as e:
         raise ValueError(f"Invalid region format: {e}")
 
 
-def create_parser() -> argparse.ArgumentParser:
+def create_parser(include_help_text: bool = True) -> argparse.ArgumentParser:
     """
     Create and configure the argument parser.
 
+    Args:
+        include_help_text: Attach the examples epilog and its raw formatter.
+            Only ``--help`` output uses them, so parsing can skip them.
+
     Returns:
         argparse.ArgumentParser: Configured parser
     """
     parser = argparse.ArgumentParser(
         prog="screenshot-capturer",
         description="Cross-platform desktop screenshot capture tool",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  # Capture full screen to default location
-  screenshot-capturer
-
-  # Capture to specific file
-  screenshot-capturer -o ~/Pictures/my_screenshot.png
-
-  # Capture a region (x, y, width, height)
-  screenshot-capturer -m region -r 100,100,800,600
-
-  # Capture as JPEG with custom quality
-  screenshot-capturer -f jpeg -q 85
-
-  # Show current configuration
-  screenshot-capturer --show-config
-
-For more information, visit: https://github.com/codeforgood-org/desktop-screenshot-capturer
-        """,
+        formatter_class=(
+            argparse.RawDescriptionHelpFormatter
+            if include_help_text
+            else argparse.HelpFormatter
+        ),
+        epilog=_EPILOG if include_help_text else None,
     )
 
     parser.add_argument(
@@ -93,7 +141,7 @@ For more information, visit: https://github.com/codeforgood-org/desktop-screensh
         "-m",
         "--mode",
         type=str,
-        choices=["fullscreen", "region", "active_window"],
+        choices=_MODE_CHOICES,
         default="fullscreen",
         help="Screenshot capture mode (default: fullscreen)",
     )
@@ -119,7 +167,7 @@ For more information, visit: https://github.com/codeforgood-org/desktop-screensh
         "-f",
         "--format",
         type=str,
-        choices=["png", "jpeg", "jpg", "bmp", "gif", "tiff", "webp"],
+        choices=_FORMAT_CHOICES,
         default="png",
         help="Output image format (default: png)",
     )
@@ -159,42 +207,88 @@ For more information, visit: https://github.com/codeforgood-org/desktop-screensh
         "-v", "--verbose", action="store_true", help="Enable verbose output"
     )
 
+    # -q is taken by --quality, so --quiet has no short form
     parser.add_argument(
-        "-q", "--quiet", action="store_true", help="Suppress all output except errors"
+        "--quiet", action="store_true", help="Suppress all output except errors"
     )
 
     return parser
 
 
-def handle_config_display(config: Config):
+def handle_config_display(config: Config) -> None:
     """Display current configuration."""
-    print("Current Configuration:")
-    print(f"  Default Format: {config.default_format}")
-    print(f"  Default Directory: {config.default_output_dir}")
-    print(f"  Default Quality: {config.default_quality}")
-    print(f"  Config File: {config.config_file}")
+    sys.stdout.write(
+        "Current Configuration:\n"
+        f"  Default Format: {config.default_format}\n"
+        f"  Default Directory: {config.default_output_dir}\n"
+        f"  Default Quality: {config.default_quality}\n"
+        f"  Config File: {config.config_file}\n"
+    )
 
 
-def handle_config_update(config: Config, args: argparse.Namespace):
+def handle_config_update(config: Config, args: argparse.Namespace) -> None:
     """Update configuration based on arguments."""
-    updated = False
+    # Messages are collected and written once at the end
+    messages = []
 
     if args.set_default_format:
-        config.default_format = args.set_default_format.upper()
-        updated = True
-        print(f"Default format set to: {config.default_format}")
+        config.default_format = args.set_default_format
+        messages.append(f"Default format set to: {config.default_format}\n")
 
     if args.set_default_dir:
         config.default_output_dir = Path(args.set_default_dir)
-        updated = True
-        print(f"Default directory set to: {config.default_output_dir}")
+        messages.append(f"Default directory set to: {config.default_output_dir}\n")
+
+    if messages:
+        # Setting a value to what it already is leaves the file untouched
+        if config.dirty:
+            config.save()
+            messages.append("Configuration saved successfully\n")
+        else:
+            messages.append("Configuration unchanged\n")
+        sys.stdout.write("".join(messages))
+
 
-    if updated:
-        config.save()
-        print("Configuration saved successfully")
+def _wants_help(argv: list) -> bool:
+    """
+    Return True if the arguments may ask for ``--help``.
+
+    Matches ``-h``, short-option clusters containing ``h`` and any prefix of
+    ``--help``. False positives only cost the full help setup.
+    """
+    for arg in argv:
+        if arg.startswith("--h"):
+            return True
+        if arg.startswith("-") and not arg.startswith("--") and "h" in arg:
+            return True
+    return False
 
 
-def main(argv: Optional[list] = None) -> int:
+def _fast_path(argv: list) -> int | None:
+    """
+    Handle invocations that don't need the full argument parser.
+
+    ``--version`` and ``--show-config`` given on their own are answered
+    directly, skipping parser construction.
+
+    Args:
+        argv: Command-line arguments
+
+    Returns:
+        int: Exit code if the invocation was handled, otherwise None
+    """
+    if argv == ["--version"]:
+        print(f"screenshot-capturer {__version__}")
+        return 0
+
+    if argv == ["--show-config"]:
+        handle_config_display(Config.shared())
+        return 0
+
+    return None
+
+
+def main(argv: list | None = None) -> int:
     """
     Main CLI entry point.
 
@@ -204,23 +298,37 @@ def main(argv: Optional[list] = None) -> int:
     Returns:
         int: Exit code (0 for success, non-zero for errors)
     """
-    parser = create_parser()
-    args = parser.parse_args(argv)
+    if argv is None:
+        argv = sys.argv[1:]
 
+    args = None
     try:
-        # Load configuration
-        config = Config()
+        exit_code = _fast_path(argv)
+        if exit_code is not None:
+            return exit_code
+
+        if argv:
+            args = create_parser(include_help_text=_wants_help(argv)).parse_args(argv)
+        else:
+            # A bare invocation takes every default, so skip building the parser
+            args = argparse.Namespace(**_DEFAULT_ARGS)
 
         # Handle configuration display
         if args.show_config:
-            handle_config_display(config)
+            handle_config_display(Config.shared())
             return 0
 
         # Handle configuration updates
         if args.set_default_format or args.set_default_dir:
-            handle_config_update(config, args)
+            try:
+                handle_config_update(Config.shared(), args)
+            except ValueError as e:
+                print(f"Error: {e}", file=sys.stderr)
+                return 1
             return 0
 
+        from .capturer import ScreenshotCapturer
+
         # Initialize capturer
         if args.verbose:
             print("Initializing screenshot capturer...")
@@ -250,8 +358,10 @@ def main(argv: Optional[list] = None) -> int:
 
         # Determine output path
         if args.output:
+            # An explicit path consults no defaults, so no Config is built
             output_path = Path(args.output)
         else:
+            config = Config.shared()
             output_dir = config.default_output_dir
             format_ext = args.format if args.format else config.default_format
             filename = generate_filename(format_ext)
@@ -288,7 +398,7 @@ def main(argv: Optional[list] = None) -> int:
         return 130
     except Exception as e:
         print(f"Unexpected error: {e}", file=sys.stderr)
-        if args.verbose:
+        if args is not None and args.verbose:
             import traceback
 
             traceback.print_exc()
@@ -2,9 +2,164 @@
 Configuration management for screenshot capturer.
 """
 
-import json
+from __future__ import annotations
+
+import functools
+import os
+import sys
 from pathlib import Path
-from typing import Any, Dict, Optional
+
+# Annotations are never evaluated at runtime, so typing is only imported for
+# type checkers (which treat TYPE_CHECKING as true)
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+
+__all__ = ["Config"]
+
+try:
+    import orjson
+
+    def _loads(data: bytes | memoryview) -> Any:
+        return orjson.loads(data)
+
+    # orjson parses any buffer, so files this large are memory-mapped rather
+    # than copied into a bytes object first
+    _MMAP_THRESHOLD: int | None = 64 * 1024
+
+    def _dumps(data: dict[str, Any]) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+    import json
+
+    def _loads(data: bytes | memoryview) -> Any:
+        # Only ever given bytes (see _MMAP_THRESHOLD), for which bytes() is a
+        # no-op; json.loads without arguments reuses a shared decoder
+        return json.loads(bytes(data))
+
+    # json.loads needs real bytes, so mapping the file would save nothing
+    _MMAP_THRESHOLD = None
+
+    # Compact separators keep the stdlib encoder on its C fast path; orjson
+    # above stays indented since the file is meant to be editable. Built once,
+    # as json.dumps() constructs a new encoder per call for non-default options.
+    _encode = json.JSONEncoder(separators=(",", ":")).encode
+
+    def _dumps(data: dict[str, Any]) -> bytes:
+        return _encode(data).encode("utf-8")
+
+
+# Formats accepted as default_format, in the canonical (upper-case) spelling
+# the setter stores; interned so stored values share one string object
+_VALID_FORMATS = frozenset(
+    map(sys.intern, ("PNG", "JPEG", "JPG", "BMP", "GIF", "TIFF", "WEBP"))
+)
+
+_QUALITY_RANGE_MESSAGE = "Quality must be between 1 and 100"
+
+
+def _checked_format(value: Any) -> str:
+    """
+    Return value as a canonical, interned format name.
+
+    Raises:
+        ValueError: If value is not a format the capturer can write
+    """
+    fmt = sys.intern(value.upper()) if isinstance(value, str) else None
+    if fmt not in _VALID_FORMATS:
+        raise ValueError(
+            f"Unsupported format '{value}' "
+            f"(expected one of: {', '.join(sorted(_VALID_FORMATS))})"
+        )
+    return fmt
+
+
+def _checked_quality(value: Any) -> int:
+    """
+    Return value if it is a valid JPEG quality.
+
+    Raises:
+        ValueError: If value is not an integer (bools excluded) in 1-100
+    """
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise ValueError(f"Quality must be an integer (got {value!r})")
+    if not 1 <= value <= 100:
+        raise ValueError(_QUALITY_RANGE_MESSAGE)
+    return value
+
+
+def _checked_output_dir(value: Any) -> str:
+    """
+    Return value if it can be stored as the output directory.
+
+    Raises:
+        ValueError: If value is not a string
+    """
+    if not isinstance(value, str):
+        raise ValueError(f"Output directory must be a string (got {value!r})")
+    return value
+
+
+# Validation shared by the setters and load(), keyed by config field
+_FIELD_CHECKS = {
+    "default_format": _checked_format,
+    "default_quality": _checked_quality,
+    "default_output_dir": _checked_output_dir,
+}
+
+
+def _parse_file(path: str, size: int) -> Any:
+    """
+    Read and decode the JSON file at path.
+
+    Args:
+        path: File to read
+        size: File size from a prior stat, used to choose read() or mmap
+
+    Returns:
+        The decoded JSON document; callers check that it is an object
+
+    Raises:
+        ValueError: If the file is not valid JSON
+    """
+    with open(path, "rb") as f:
+        if _MMAP_THRESHOLD is None or size < _MMAP_THRESHOLD:
+            return _loads(f.read())
+
+        import mmap
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return _loads(view)
+
+
+@functools.lru_cache(maxsize=8)
+def _output_dir_path(value: str) -> Path:
+    """
+    Return the stored output directory as an expanded Path.
+
+    Paths are immutable, so one instance is shared per stored string (in
+    practice, the default ``"."``) instead of being rebuilt on every access.
+    """
+    return Path(value).expanduser()
+
+
+@functools.lru_cache(maxsize=1)
+def _default_config_path() -> str:
+    """Return the default configuration file location (resolved once)."""
+    return os.path.join(
+        os.path.expanduser("~"), ".config", "screenshot-capturer", "config.json"
+    )
+
+
+# Parsed file contents keyed by path, with the (mtime_ns, size) they were
+# read at; lets repeated Config(path) loads skip re-parsing an unchanged file
+_PARSE_CACHE: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
+
+# Config instances shared within the process, keyed by file path; see
+# Config.shared()
+_INSTANCE_CACHE: dict[str, Config] = {}
 
 
 class Config:
@@ -13,15 +168,19 @@ class Config:
 
     Handles loading, saving, and accessing configuration options.
     Configuration is stored in a JSON file in the user's home directory.
+    The file is not touched until a value is first read or written, so
+    creating a Config is free on paths that never consult it.
     """
 
+    __slots__ = ("_config_path", "_config", "_dirty")
+
     DEFAULT_CONFIG = {
         "default_format": "PNG",
         "default_quality": 95,
         "default_output_dir": ".",
     }
 
-    def __init__(self, config_file: Optional[Path] = None):
+    def __init__(self, config_file: str | Path | None = None):
         """
         Initialize configuration manager.
 
@@ -29,42 +188,140 @@ class Config:
             config_file: Path to configuration file. If None, uses default location.
         """
         if config_file is None:
-            config_dir = Path.home() / ".config" / "screenshot-capturer"
-            config_dir.mkdir(parents=True, exist_ok=True)
-            config_file = config_dir / "config.json"
+            config_file = _default_config_path()
+
+        # Kept as a plain string; os.path is cheaper than pathlib for the
+        # handful of filesystem calls made here
+        self._config_path = os.fspath(config_file)
+        # Loaded on first access; see _ensure_loaded()
+        self._config: dict[str, Any] | None = None
+        # Set when a value changes; cleared by load() and save()
+        self._dirty = False
+
+    @classmethod
+    def shared(cls, config_file: str | Path | None = None) -> Config:
+        """
+        Return a Config for the given file, reusing an earlier instance.
 
-        self.config_file = config_file
-        self._config: Dict[str, Any] = {}
-        self.load()
+        Repeated calls with the same path return the same object, so the
+        file is read at most once per process.
 
-    def load(self):
+        Args:
+            config_file: Path to configuration file. If None, uses default location.
+
+        Returns:
+            Config: The shared configuration instance
+        """
+        if config_file is None:
+            config_file = _default_config_path()
+
+        key = os.fspath(config_file)
+        config = _INSTANCE_CACHE.get(key)
+        if config is None:
+            config = _INSTANCE_CACHE[key] = cls(key)
+        return config
+
+    @property
+    def config_file(self) -> Path:
+        """Path to the configuration file."""
+        return Path(self._config_path)
+
+    def _ensure_loaded(self) -> dict[str, Any]:
+        """Load the configuration file on first use and return its values."""
+        if self._config is None:
+            self.load()
+        assert self._config is not None
+        return self._config
+
+    def load(self) -> None:
         """Load configuration from file or create default if it doesn't exist."""
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, "r", encoding="utf-8") as f:
-                    self._config = json.load(f)
-                # Ensure all default keys exist
-                for key, value in self.DEFAULT_CONFIG.items():
-                    if key not in self._config:
-                        self._config[key] = value
-            except (json.JSONDecodeError, IOError):
-                # If config is corrupted, use defaults
-                self._config = self.DEFAULT_CONFIG.copy()
-        else:
+        self._dirty = False
+        try:
+            st = os.stat(self._config_path)
+        except OSError:
             # Create default config
             self._config = self.DEFAULT_CONFIG.copy()
             self.save()
+            return
+
+        # Reuse an earlier parse while the file is unchanged on disk
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = _PARSE_CACHE.get(self._config_path)
+        if cached is not None and cached[0] == stamp:
+            self._config = cached[1].copy()
+            return
+
+        try:
+            data = _parse_file(self._config_path, st.st_size)
+            if not isinstance(data, dict):
+                raise ValueError("Configuration must be a JSON object")
+            # Ensure all default keys exist and pass the setters' checks, in
+            # one pass; a missing or invalid value falls back to its default
+            for key, value in self.DEFAULT_CONFIG.items():
+                try:
+                    data[key] = _FIELD_CHECKS[key](data[key])
+                except (KeyError, ValueError):
+                    data[key] = value
+        except (ValueError, IOError):
+            # If config is corrupted, use defaults (json and orjson decode
+            # errors are both ValueErrors)
+            _PARSE_CACHE.pop(self._config_path, None)
+            self._config = self.DEFAULT_CONFIG.copy()
+        else:
+            self._config = data
+            _PARSE_CACHE[self._config_path] = (stamp, data.copy())
+
+    def save(self) -> None:
+        """
+        Save current configuration to file.
+
+        The file is written to a temporary sibling and moved into place, so
+        a crash mid-write never leaves a truncated config behind. A symlinked
+        config path is resolved first, so the link itself is kept and its
+        target is the file that gets replaced.
+
+        Raises:
+            OSError: If the file cannot be written
+        """
+        config = self._ensure_loaded()
+        target = os.path.realpath(self._config_path)
 
-    def save(self):
-        """Save current configuration to file."""
+        # Ensure directory exists
+        config_dir = os.path.dirname(target)
+        if config_dir:
+            os.makedirs(config_dir, exist_ok=True)
+
+        tmp_path = f"{target}.tmp"
         try:
-            # Ensure directory exists
-            self.config_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(_dumps(config))
+            os.replace(tmp_path, target)
+        except BaseException:
+            # Don't leave a stray temporary file next to the config
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        self._dirty = False
+
+        st = os.stat(self._config_path)
+        _PARSE_CACHE[self._config_path] = (
+            (st.st_mtime_ns, st.st_size),
+            config.copy(),
+        )
 
-            with open(self.config_file, "w", encoding="utf-8") as f:
-                json.dump(self._config, f, indent=2)
-        except IOError as e:
-            raise IOError(f"Failed to save configuration: {e}")
+    @property
+    def dirty(self) -> bool:
+        """Whether any value has changed since the last load or save."""
+        return self._dirty
+
+    def _update(self, key: str, value: Any) -> None:
+        """Store a value, marking the configuration dirty if it changed."""
+        config = self._ensure_loaded()
+        if key not in config or config[key] != value:
+            config[key] = value
+            self._dirty = True
 
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -77,9 +334,9 @@ class Config:
         Returns:
             Configuration value or default
         """
-        return self._config.get(key, default)
+        return self._ensure_loaded().get(key, default)
 
-    def set(self, key: str, value: Any):
+    def set(self, key: str, value: Any) -> None:
         """
         Set a configuration value.
 
@@ -87,45 +344,55 @@ class Config:
             key: Configuration key
             value: Configuration value
         """
-        self._config[key] = value
+        self._update(key, value)
 
     @property
     def default_format(self) -> str:
         """Get default image format."""
-        return self._config["default_format"]
+        value: str = self._ensure_loaded()["default_format"]
+        return value
 
     @default_format.setter
-    def default_format(self, value: str):
-        """Set default image format."""
-        self._config["default_format"] = value.upper()
+    def default_format(self, value: str) -> None:
+        """
+        Set default image format.
+
+        Raises:
+            ValueError: If the format is not one the capturer can write
+        """
+        self._update("default_format", _checked_format(value))
 
     @property
     def default_quality(self) -> int:
         """Get default JPEG quality."""
-        return self._config["default_quality"]
+        value: int = self._ensure_loaded()["default_quality"]
+        return value
 
     @default_quality.setter
-    def default_quality(self, value: int):
-        """Set default JPEG quality."""
-        if not 1 <= value <= 100:
-            raise ValueError("Quality must be between 1 and 100")
-        self._config["default_quality"] = value
+    def default_quality(self, value: int) -> None:
+        """
+        Set default JPEG quality.
+
+        Raises:
+            ValueError: If value is not an integer between 1 and 100
+        """
+        self._update("default_quality", _checked_quality(value))
 
     @property
     def default_output_dir(self) -> Path:
         """Get default output directory."""
-        return Path(self._config["default_output_dir"]).expanduser()
+        return _output_dir_path(self._ensure_loaded()["default_output_dir"])
 
     @default_output_dir.setter
-    def default_output_dir(self, value: Path):
+    def default_output_dir(self, value: Path) -> None:
         """Set default output directory."""
-        self._config["default_output_dir"] = str(value)
+        self._update("default_output_dir", str(value))
 
-    def reset(self):
+    def reset(self) -> None:
         """Reset configuration to defaults."""
         self._config = self.DEFAULT_CONFIG.copy()
         self.save()
 
     def __repr__(self) -> str:
         """String representation of configuration."""
-        return f"Config({self._config})"
+        return f"Config({self._ensure_loaded()})"
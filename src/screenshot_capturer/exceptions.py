@@ -2,34 +2,53 @@
 Custom exceptions for the screenshot capturer module.
 """
 
+from __future__ import annotations
+
+__all__ = [
+    "ScreenshotCapturerError",
+    "PlatformNotSupportedError",
+    "CaptureFailedError",
+    "InvalidRegionError",
+    "SaveError",
+]
+
 
 class ScreenshotCapturerError(Exception):
     """Base exception for all screenshot capturer errors."""
 
-    pass
+    # BaseException still provides a lazily created __dict__; the slots only
+    # keep the attributes defined here out of it
+    __slots__ = ()
 
 
 class PlatformNotSupportedError(ScreenshotCapturerError):
     """Raised when the current platform is not supported."""
 
+    __slots__ = ("platform",)
+
     def __init__(self, platform: str):
         self.platform = platform
         super().__init__(f"Platform '{platform}' is not supported")
 
+    def __reduce__(self) -> tuple[type[PlatformNotSupportedError], tuple[str]]:
+        # Slots are not part of the default exception pickle state, so rebuild
+        # from the platform rather than from the formatted message
+        return (type(self), (self.platform,))
+
 
 class CaptureFailedError(ScreenshotCapturerError):
     """Raised when screenshot capture fails."""
 
-    pass
+    __slots__ = ()
 
 
 class InvalidRegionError(ScreenshotCapturerError):
     """Raised when an invalid region is specified for capture."""
 
-    pass
+    __slots__ = ()
 
 
 class SaveError(ScreenshotCapturerError):
     """Raised when saving a screenshot fails."""
 
-    pass
+    __slots__ = ()
@@ -2,11 +2,14 @@
 Pytest configuration and shared fixtures.
 """
 
+import os
 import tempfile
 from pathlib import Path
 
 import pytest
 
+from screenshot_capturer import config as config_module
+
 
 @pytest.fixture
 def temp_dir():
@@ -15,13 +18,31 @@ def temp_dir():
         yield Path(tmpdir)
 
 
+# Linux tmpfs; config tests write many tiny files and gain nothing from disk
+_SHM_DIR = "/dev/shm"
+
+
 @pytest.fixture
 def temp_config_file(temp_dir):
-    """Create a temporary config file path."""
-    return temp_dir / "test_config.json"
+    """Create a temporary config file path, in memory where available."""
+    if os.path.isdir(_SHM_DIR) and os.access(_SHM_DIR, os.W_OK):
+        with tempfile.TemporaryDirectory(dir=_SHM_DIR) as tmpdir:
+            yield Path(tmpdir) / "test_config.json"
+    else:
+        yield temp_dir / "test_config.json"
 
 
 @pytest.fixture
 def sample_image_path(temp_dir):
     """Return path for a sample image file."""
     return temp_dir / "test_screenshot.png"
+
+
+@pytest.fixture(autouse=True)
+def isolated_default_config(tmp_path, monkeypatch):
+    """Point the default config location at a per-test temporary file."""
+    default_path = str(tmp_path / "config.json")
+    monkeypatch.setattr(config_module, "_default_config_path", lambda: default_path)
+    monkeypatch.setattr(config_module, "_INSTANCE_CACHE", {})
+    monkeypatch.setattr(config_module, "_PARSE_CACHE", {})
+    return default_path
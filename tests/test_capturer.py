@@ -2,6 +2,7 @@
 Tests for the screenshot capturer module.
 """
 
+import dataclasses
 import io
 from pathlib import Path
 
@@ -16,6 +17,7 @@ from screenshot_capturer.capturer import (
 from screenshot_capturer.exceptions import (
     CaptureFailedError,
     InvalidRegionError,
+    PlatformNotSupportedError,
     SaveError,
 )
 
@@ -36,6 +38,13 @@ class TestRegion:
         region = Region(x=100, y=100, width=400, height=300)
         assert region.bbox == (100, 100, 500, 400)
 
+    def test_region_is_immutable(self):
+        """Test regions cannot be modified after construction."""
+        region = Region(x=0, y=0, width=10, height=10)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            region.width = 20
+        assert region == Region(x=0, y=0, width=10, height=10)
+
     def test_invalid_dimensions(self):
         """Test region with invalid dimensions."""
         with pytest.raises(InvalidRegionError):
@@ -62,6 +71,139 @@ class TestScreenshotCapturer:
         assert capturer is not None
         assert capturer.platform in ["Windows", "Linux", "Darwin"]
 
+    def test_invalid_png_compress_level(self):
+        """Test that out-of-range PNG compress levels are rejected."""
+        with pytest.raises(ValueError):
+            ScreenshotCapturer(png_compress_level=10)
+
+        with pytest.raises(ValueError):
+            ScreenshotCapturer(png_compress_level=-1)
+
+    def test_png_compress_level_roundtrip(self):
+        """Test PNG bytes decode correctly at different compress levels."""
+        image = Image.new("RGB", (64, 48), "red")
+        for level in (0, 1, 6, 9):
+            capturer = ScreenshotCapturer(png_compress_level=level)
+            data = capturer.get_screenshot_bytes(image, format="PNG")
+            loaded = Image.open(io.BytesIO(data))
+            assert loaded.size == image.size
+            assert loaded.getpixel((0, 0)) == (255, 0, 0)
+
+    def test_save_screenshot_writes_complete_file(self, temp_dir):
+        """Test buffered saves produce decodable files, including .jpg."""
+        capturer = ScreenshotCapturer()
+        image = Image.new("RGB", (320, 240), "blue")
+
+        for ext, expected in [(".png", "PNG"), (".jpg", "JPEG"), (".bmp", "BMP")]:
+            result = capturer.save_screenshot(image, temp_dir / f"synthetic{ext}")
+            with Image.open(result) as loaded:
+                assert loaded.format == expected
+                assert loaded.size == image.size
+
+    def test_get_screenshot_bytes_reuses_buffer(self):
+        """Test a smaller encode after a larger one returns only its own bytes."""
+        capturer = ScreenshotCapturer()
+        large = Image.new("RGB", (640, 480), "green")
+        small = Image.new("RGB", (8, 8), "blue")
+
+        large_bytes = capturer.get_screenshot_bytes(large, format="BMP")
+        small_bytes = capturer.get_screenshot_bytes(small, format="PNG")
+
+        assert len(small_bytes) < len(large_bytes)
+        assert Image.open(io.BytesIO(small_bytes)).size == small.size
+        assert capturer.get_screenshot_bytes(large, format="BMP") == large_bytes
+
+    def test_save_screenshot_async(self, temp_dir):
+        """Test background saves resolve to the saved path."""
+        image = Image.new("RGB", (64, 48), "red")
+        with ScreenshotCapturer() as capturer:
+            futures = [
+                capturer.save_screenshot_async(image, temp_dir / f"async_{i}.png")
+                for i in range(3)
+            ]
+            results = [future.result() for future in futures]
+
+        for i, result in enumerate(results):
+            assert result == (temp_dir / f"async_{i}.png").absolute()
+            assert result.exists()
+
+    def test_close_waits_for_pending_saves(self, temp_dir):
+        """Test close() lets queued saves finish."""
+        capturer = ScreenshotCapturer()
+        image = Image.new("RGB", (64, 48), "red")
+        future = capturer.save_screenshot_async(image, temp_dir / "pending.png")
+        capturer.close()
+        assert future.done()
+        assert future.result().exists()
+
+    def test_rgba_saves_as_jpeg(self, temp_dir):
+        """Test RGBA images are converted to RGB for JPEG output."""
+        capturer = ScreenshotCapturer(use_turbojpeg=False)
+        image = Image.new("RGBA", (32, 16), (255, 0, 0, 128))
+
+        data = capturer.get_screenshot_bytes(image, format="JPEG")
+        assert Image.open(io.BytesIO(data)).mode == "RGB"
+
+        result = capturer.save_screenshot(image, temp_dir / "rgba.jpg")
+        with Image.open(result) as loaded:
+            assert loaded.mode == "RGB"
+            assert loaded.size == image.size
+
+    def test_get_screenshot_bytes_defaults_to_lossless_webp(self):
+        """Test the in-memory default format is lossless WebP."""
+        features = pytest.importorskip("PIL.features")
+        if not features.check_module("webp"):
+            pytest.skip("Pillow built without WebP support")
+
+        capturer = ScreenshotCapturer()
+        image = Image.new("RGB", (32, 16), (12, 34, 56))
+        data = capturer.get_screenshot_bytes(image)
+
+        loaded = Image.open(io.BytesIO(data))
+        assert loaded.format == "WEBP"
+        assert loaded.convert("RGB").getpixel((5, 5)) == (12, 34, 56)
+
+    def test_webp_uses_fastest_lossless_effort(self):
+        """Test WebP output is lossless at quality 0 with the chosen method."""
+        capturer = ScreenshotCapturer(webp_method=2)
+        fmt, kwargs = capturer._resolve_format("webp", 95)
+        assert fmt == "WEBP"
+        assert kwargs == {"lossless": True, "quality": 0, "method": 2}
+
+    def test_invalid_webp_method(self):
+        """Test that out-of-range WebP methods are rejected."""
+        with pytest.raises(ValueError):
+            ScreenshotCapturer(webp_method=7)
+
+    def test_failed_save_unknown_format_leaves_no_file(self, temp_dir):
+        """Test an unknown suffix fails without creating the output file."""
+        capturer = ScreenshotCapturer()
+        target = temp_dir / "shot.xyz"
+        with pytest.raises(SaveError):
+            capturer.save_screenshot(Image.new("RGB", (8, 8)), target)
+        assert not target.exists()
+
+    def test_failed_encode_leaves_no_file(self, temp_dir):
+        """Test a mode the encoder rejects leaves no partial file behind."""
+        capturer = ScreenshotCapturer()
+        target = temp_dir / "shot.bmp"
+        with pytest.raises(SaveError):
+            capturer.save_screenshot(Image.new("LA", (8, 8)), target)
+        assert not target.exists()
+
+    def test_save_recreates_removed_directory(self, temp_dir):
+        """Test saving still works after a cached output directory is removed."""
+        capturer = ScreenshotCapturer()
+        image = Image.new("RGB", (8, 8), "red")
+        output_dir = temp_dir / "frames"
+
+        capturer.save_screenshot(image, output_dir / "first.png")
+        (output_dir / "first.png").unlink()
+        output_dir.rmdir()
+
+        result = capturer.save_screenshot(image, output_dir / "second.png")
+        assert result.exists()
+
     def test_supported_formats(self):
         """Test supported formats property."""
         capturer = ScreenshotCapturer()
@@ -192,6 +334,287 @@ class TestScreenshotCapturer:
             capturer.quick_capture(mode=CaptureMode.REGION)
 
 
+class _FakeShot:
+    """Minimal stand-in for an mss ScreenShot."""
+
+    def __init__(self, width, height, bgra_pixel):
+        self.size = (width, height)
+        self.raw = bytearray(bgra_pixel) * (width * height)
+
+
+class _FakeSct:
+    """Minimal stand-in for an mss.mss() handle that records grabs."""
+
+    monitors = [{"left": 0, "top": 0, "width": 4, "height": 3}]
+
+    def __init__(self):
+        self.grabbed = []
+
+    def grab(self, monitor):
+        self.grabbed.append(monitor)
+        return _FakeShot(monitor["width"], monitor["height"], (255, 0, 0, 255))
+
+
+class TestMssBackend:
+    """Tests for the mss capture backend."""
+
+    def test_fullscreen_uses_mss(self):
+        """Test fullscreen grabs the virtual screen and converts BGRA to RGB."""
+        capturer = ScreenshotCapturer()
+        capturer._sct = sct = _FakeSct()
+
+        screenshot = capturer.capture_fullscreen()
+        assert sct.grabbed == [_FakeSct.monitors[0]]
+        assert screenshot.mode == "RGB"
+        assert screenshot.size == (4, 3)
+        assert screenshot.getpixel((0, 0)) == (0, 0, 255)
+
+    def test_handle_falls_back_when_unavailable(self, monkeypatch):
+        """Test a display error from mss disables it instead of raising."""
+        from mss.exception import ScreenShotError
+
+        def no_display():
+            raise ScreenShotError("no display")
+
+        monkeypatch.setattr("mss.MSS", no_display, raising=False)
+        monkeypatch.setattr("mss.mss", no_display)
+        capturer = ScreenshotCapturer()
+
+        assert capturer._get_sct() is None
+        assert capturer._sct_unavailable
+
+    def test_handle_propagates_unexpected_errors(self, monkeypatch):
+        """Test errors unrelated to the display are not swallowed."""
+
+        def broken():
+            raise RuntimeError("bug")
+
+        monkeypatch.setattr("mss.MSS", broken, raising=False)
+        monkeypatch.setattr("mss.mss", broken)
+        capturer = ScreenshotCapturer()
+
+        with pytest.raises(RuntimeError):
+            capturer._get_sct()
+
+    def test_region_uses_mss(self):
+        """Test region capture passes the region as an mss monitor dict."""
+        capturer = ScreenshotCapturer()
+        capturer._sct = sct = _FakeSct()
+
+        screenshot = capturer.capture_region(Region(x=5, y=6, width=2, height=1))
+        assert sct.grabbed == [{"left": 5, "top": 6, "width": 2, "height": 1}]
+        assert screenshot.size == (2, 1)
+
+    def test_full_screen_region_uses_fullscreen_path(self):
+        """Test a region equal to the whole screen grabs the full monitor."""
+        capturer = ScreenshotCapturer()
+        capturer._sct = sct = _FakeSct()
+
+        capturer.capture_region(Region(x=0, y=0, width=4, height=3))
+        assert sct.grabbed[-1] is _FakeSct.monitors[0]
+
+
+class _FakeWindll:
+    """Minimal stand-in for ctypes.windll with user32 and dwmapi."""
+
+    def __init__(self, calls, dwm_rect, window_rect):
+        self.user32 = self
+        self.dwmapi = self
+        self.calls = calls
+        self.dwm_rect = dwm_rect
+        self.window_rect = window_rect
+
+    @staticmethod
+    def _fill(ref, bounds):
+        rect = ref._obj
+        rect.left, rect.top, rect.right, rect.bottom = bounds
+
+    def GetForegroundWindow(self):
+        return 1
+
+    def DwmGetWindowAttribute(self, hwnd, attribute, ref, size):
+        self.calls.append(("dwm", attribute))
+        if self.dwm_rect is None:
+            return -2147467259  # E_FAIL
+        self._fill(ref, self.dwm_rect)
+        return 0
+
+    def GetWindowRect(self, hwnd, ref):
+        self.calls.append("GetWindowRect")
+        self._fill(ref, self.window_rect)
+        return 1
+
+
+class TestActiveWindow:
+    """Tests for active window capture."""
+
+    def _windows_capturer(self, monkeypatch, calls, dwm_rect):
+        import ctypes
+
+        capturer = ScreenshotCapturer()
+        capturer._platform = "Windows"
+        windll = _FakeWindll(calls, dwm_rect, (5, 6, 25, 36))
+        monkeypatch.setattr(ctypes, "windll", windll, raising=False)
+
+        def get_sct(self):
+            calls.append("get_sct")
+            return None
+
+        monkeypatch.setattr(ScreenshotCapturer, "_get_sct", get_sct)
+        return capturer
+
+    def test_windows_uses_dwm_frame_bounds(self, monkeypatch):
+        """Test the visible DWM frame is used, after DPI awareness is set."""
+        calls = []
+        capturer = self._windows_capturer(monkeypatch, calls, (10, 20, 30, 40))
+
+        region = capturer._active_window_region()
+        assert region == Region(x=10, y=20, width=20, height=20)
+        assert calls == ["get_sct", ("dwm", 9)]
+
+    def test_windows_falls_back_to_window_rect(self, monkeypatch):
+        """Test GetWindowRect is used when DWM cannot report the frame."""
+        calls = []
+        capturer = self._windows_capturer(monkeypatch, calls, None)
+
+        region = capturer._active_window_region()
+        assert region == Region(x=5, y=6, width=20, height=30)
+        assert calls == ["get_sct", ("dwm", 9), "GetWindowRect"]
+
+    def test_grabs_only_window_rectangle(self, monkeypatch):
+        """Test the active window's rectangle is grabbed directly."""
+        capturer = ScreenshotCapturer()
+        capturer._platform = "Windows"
+        capturer._sct = sct = _FakeSct()
+        monkeypatch.setattr(
+            ScreenshotCapturer,
+            "_active_window_region",
+            lambda self: Region(x=10, y=20, width=3, height=2),
+        )
+
+        screenshot = capturer.capture_active_window()
+        assert sct.grabbed == [{"left": 10, "top": 20, "width": 3, "height": 2}]
+        assert screenshot.size == (3, 2)
+
+    def test_falls_back_to_fullscreen(self, monkeypatch):
+        """Test an unknown window rectangle falls back to the whole screen."""
+        capturer = ScreenshotCapturer()
+        capturer._platform = "Darwin"
+        capturer._sct = sct = _FakeSct()
+        monkeypatch.setattr(
+            ScreenshotCapturer, "_active_window_region", lambda self: None
+        )
+
+        capturer.capture_active_window()
+        assert sct.grabbed == [_FakeSct.monitors[0]]
+
+    def test_not_supported_on_linux(self):
+        """Test Linux reports active window capture as unsupported."""
+        capturer = ScreenshotCapturer()
+        capturer._platform = "Linux"
+        with pytest.raises(PlatformNotSupportedError):
+            capturer.capture_active_window()
+
+
+class TestArrayCapture:
+    """Tests for the NumPy array capture path."""
+
+    def test_capture_fullscreen_np_is_bgra_view(self):
+        """Test array capture returns a BGRA view over the mss buffer."""
+        np = pytest.importorskip("numpy")
+        capturer = ScreenshotCapturer()
+        capturer._sct = _FakeSct()
+
+        array = capturer.capture_fullscreen_np()
+        assert array.shape == (3, 4, 4)
+        assert array.dtype == np.uint8
+        assert tuple(array[0, 0]) == (255, 0, 0, 255)
+
+    def test_capture_stream_yields_independent_frames(self):
+        """Test streamed frames are separate captures, not a reused buffer."""
+        pytest.importorskip("numpy")
+        capturer = ScreenshotCapturer()
+        capturer._sct = _FakeSct()
+
+        frames = list(capturer.capture_stream(fps=1000, count=3))
+        assert len(frames) == 3
+        assert len(capturer._sct.grabbed) == 3
+        assert frames[0] is not frames[1]
+        assert frames[0].shape == (3, 4, 4)
+
+    def test_capture_stream_rejects_bad_fps(self):
+        """Test a non-positive fps is rejected."""
+        capturer = ScreenshotCapturer()
+        with pytest.raises(ValueError):
+            next(capturer.capture_stream(fps=0))
+
+    def test_save_array(self, temp_dir):
+        """Test saving a BGRA array produces an RGB image."""
+        np = pytest.importorskip("numpy")
+        capturer = ScreenshotCapturer()
+        array = np.zeros((10, 20, 4), dtype=np.uint8)
+        array[..., 0] = 255  # blue
+        array[..., 3] = 255
+
+        result = capturer.save_array(array, temp_dir / "array.png")
+        with Image.open(result) as loaded:
+            assert loaded.size == (20, 10)
+            assert loaded.getpixel((0, 0)) == (0, 0, 255)
+
+    def test_save_array_rejects_wrong_shape(self, temp_dir):
+        """Test arrays without four channels are rejected."""
+        np = pytest.importorskip("numpy")
+        capturer = ScreenshotCapturer()
+        with pytest.raises(ValueError):
+            capturer.save_array(np.zeros((10, 20, 3), np.uint8), temp_dir / "x.png")
+
+
+class _FakeTurboJPEG:
+    """Stand-in TurboJPEG encoder that records calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, array, quality, pixel_format, jpeg_subsample):
+        self.calls.append((array.shape, quality))
+        return b"turbo-jpeg"
+
+
+class TestTurboJPEG:
+    """Tests for the optional libjpeg-turbo JPEG path."""
+
+    def test_jpeg_bytes_use_turbojpeg(self):
+        """Test RGB JPEG encoding is routed through TurboJPEG when available."""
+        pytest.importorskip("numpy")
+        capturer = ScreenshotCapturer()
+        capturer._tj_unavailable = False
+        capturer._tj = tj = _FakeTurboJPEG()
+
+        image = Image.new("RGB", (16, 8), "red")
+        assert capturer.get_screenshot_bytes(image, "JPG", quality=70) == b"turbo-jpeg"
+        assert tj.calls == [((8, 16, 3), 70)]
+
+    def test_jpeg_save_uses_turbojpeg(self, temp_dir):
+        """Test saved JPEG files contain the TurboJPEG output."""
+        pytest.importorskip("numpy")
+        capturer = ScreenshotCapturer()
+        capturer._tj_unavailable = False
+        capturer._tj = _FakeTurboJPEG()
+
+        image = Image.new("RGB", (16, 8), "red")
+        result = capturer.save_screenshot(image, temp_dir / "turbo.jpg")
+        assert result.read_bytes() == b"turbo-jpeg"
+
+    def test_turbojpeg_disabled(self):
+        """Test use_turbojpeg=False always uses Pillow."""
+        capturer = ScreenshotCapturer(use_turbojpeg=False)
+        capturer._tj = _FakeTurboJPEG()
+
+        image = Image.new("RGB", (16, 8), "red")
+        data = capturer.get_screenshot_bytes(image, "JPEG")
+        assert Image.open(io.BytesIO(data)).format == "JPEG"
+
+
 class TestCaptureMode:
     """Tests for CaptureMode enum."""
 
@@ -2,6 +2,8 @@
 Tests for the CLI module.
 """
 
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
@@ -9,6 +11,7 @@ import pytest
 from screenshot_capturer.cli import (
     create_parser,
     generate_filename,
+    handle_config_update,
     parse_region,
     main,
 )
@@ -100,6 +103,27 @@ class TestCLI:
         args = parser.parse_args(["-v"])
         assert args.verbose is True
 
+    def test_parser_quiet_flag(self):
+        """Test --quiet does not clash with -q for quality."""
+        parser = create_parser()
+        args = parser.parse_args(["--quiet", "-q", "70"])
+        assert args.quiet is True
+        assert args.quality == 70
+
+    def test_main_help_includes_examples(self, capsys):
+        """Test --help still shows the examples epilog."""
+        with pytest.raises(SystemExit):
+            main(["--help"])
+        assert "Examples:" in capsys.readouterr().out
+
+    def test_parser_without_help_text(self):
+        """Test the lean parser parses the same arguments."""
+        parser = create_parser(include_help_text=False)
+        assert parser.epilog is None
+        args = parser.parse_args(["-f", "jpeg", "-q", "80"])
+        assert args.format == "jpeg"
+        assert args.quality == 80
+
     def test_parser_show_config_flag(self):
         """Test parser with show-config flag."""
         parser = create_parser()
@@ -118,6 +142,83 @@ class TestCLI:
         captured = capsys.readouterr()
         assert "Current Configuration" in captured.out
 
+    def test_handle_config_update_output(self, temp_config_file, capsys):
+        """Test config updates report each change and the save."""
+        from screenshot_capturer.config import Config
+
+        parser = create_parser()
+        args = parser.parse_args(
+            ["--set-default-format", "jpeg", "--set-default-dir", "/tmp"]
+        )
+        handle_config_update(Config(temp_config_file), args)
+
+        lines = capsys.readouterr().out.splitlines()
+        assert lines == [
+            "Default format set to: JPEG",
+            f"Default directory set to: {Path('/tmp')}",
+            "Configuration saved successfully",
+        ]
+
+    def test_handle_config_update_unchanged(self, temp_config_file, capsys):
+        """Test setting a value to its current value skips the save."""
+        from screenshot_capturer.config import Config
+
+        config = Config(temp_config_file)
+        args = create_parser().parse_args(["--set-default-format", "png"])
+        handle_config_update(config, args)
+
+        assert "Configuration unchanged" in capsys.readouterr().out
+        assert not config.dirty
+
+    def test_main_set_invalid_default_format(self, capsys):
+        """Test an unsupported --set-default-format is reported as an error."""
+        assert main(["--set-default-format", "xyz"]) == 1
+        assert "Unsupported format" in capsys.readouterr().err
+
+    def test_main_show_config_fast_path_unreadable(self, temp_dir, monkeypatch, capsys):
+        """Test --show-config alone reports an unusable config cleanly."""
+        from screenshot_capturer import config as config_module
+
+        # A regular file where the config directory should be
+        blocker = temp_dir / "not_a_dir"
+        blocker.write_bytes(b"")
+        config_path = str(blocker / "config.json")
+        monkeypatch.setattr(config_module, "_default_config_path", lambda: config_path)
+
+        assert main(["--show-config"]) == 1
+        assert "Unexpected error" in capsys.readouterr().err
+
+    def test_main_version_fast_path(self, capsys):
+        """Test --version on its own is answered without the full parser."""
+        from screenshot_capturer import __version__
+
+        assert main(["--version"]) == 0
+        captured = capsys.readouterr()
+        assert captured.out.strip() == f"screenshot-capturer {__version__}"
+
+    def test_main_explicit_output_skips_config(self, temp_dir, monkeypatch):
+        """Test an explicit output path never constructs a Config."""
+        from screenshot_capturer.capturer import ScreenshotCapturer
+        from screenshot_capturer.config import Config
+
+        def fail_config(*args, **kwargs):
+            raise AssertionError("Config should not be constructed")
+
+        monkeypatch.setattr(Config, "shared", fail_config)
+        monkeypatch.setattr(Config, "__init__", fail_config)
+        monkeypatch.setattr(
+            ScreenshotCapturer, "quick_capture", lambda self, filepath, **kw: filepath
+        )
+
+        output = temp_dir / "shot.png"
+        assert main(["-o", str(output), "--quiet"]) == 0
+
+    def test_default_args_match_parser(self):
+        """Test the bare-invocation defaults agree with the parser."""
+        from screenshot_capturer.cli import _DEFAULT_ARGS
+
+        assert vars(create_parser().parse_args([])) == _DEFAULT_ARGS
+
     def test_main_region_without_region_param(self):
         """Test main with region mode but no region parameter."""
         result = main(["-m", "region"])
@@ -131,6 +232,24 @@ class TestCLI:
         result = main(["-q", "0"])
         assert result == 1
 
+    def test_cli_import_does_not_load_pillow(self):
+        """Test importing the CLI leaves Pillow and the capturer unloaded."""
+        code = (
+            "import sys, screenshot_capturer.cli; "
+            "assert 'PIL' not in sys.modules; "
+            "assert 'screenshot_capturer.capturer' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_parse_region_does_not_load_capturer(self):
+        """Test region parsing works without importing the capturer module."""
+        code = (
+            "import sys; from screenshot_capturer.cli import parse_region; "
+            "parse_region('0,0,10,10'); "
+            "assert 'screenshot_capturer.capturer' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
     def test_main_keyboard_interrupt(self, monkeypatch):
         """Test main handles keyboard interrupt."""
         def mock_capture(*args, **kwargs):
@@ -14,9 +14,12 @@ class TestConfig:
     """Tests for the Config class."""
 
     def test_config_initialization(self, temp_config_file):
-        """Test config initialization creates file with defaults."""
+        """Test config creates the file with defaults on first access."""
         config = Config(temp_config_file)
         assert config.config_file == temp_config_file
+        assert not temp_config_file.exists()
+
+        assert config.default_format == "PNG"
         assert temp_config_file.exists()
 
     def test_default_values(self, temp_config_file):
@@ -34,8 +37,8 @@ class TestConfig:
             "default_quality": 80,
             "default_output_dir": "/tmp",
         }
-        with open(temp_config_file, "w") as f:
-            json.dump(test_config, f)
+        with open(temp_config_file, "wb") as f:
+            f.write(json.dumps(test_config).encode())
 
         config = Config(temp_config_file)
         assert config.default_format == "JPEG"
@@ -50,8 +53,8 @@ class TestConfig:
         config.save()
 
         # Reload and verify
-        with open(temp_config_file, "r") as f:
-            data = json.load(f)
+        with open(temp_config_file, "rb") as f:
+            data = json.loads(f.read())
 
         assert data["default_format"] == "BMP"
         assert data["default_quality"] == 90
@@ -74,6 +77,13 @@ class TestConfig:
         config.default_format = "jpeg"
         assert config.default_format == "JPEG"  # Should be uppercase
 
+    def test_invalid_format_value(self, temp_config_file):
+        """Test setting an unsupported default format."""
+        config = Config(temp_config_file)
+        with pytest.raises(ValueError):
+            config.default_format = "xyz"
+        assert config.default_format == "PNG"
+
     def test_default_quality_property(self, temp_config_file):
         """Test default_quality property."""
         config = Config(temp_config_file)
@@ -110,8 +120,8 @@ class TestConfig:
     def test_corrupted_config_file(self, temp_config_file):
         """Test handling of corrupted config file."""
         # Write invalid JSON
-        with open(temp_config_file, "w") as f:
-            f.write("not valid json {{{")
+        with open(temp_config_file, "wb") as f:
+            f.write(b"not valid json {{{")
 
         # Should load defaults without crashing
         config = Config(temp_config_file)
@@ -122,8 +132,8 @@ class TestConfig:
         """Test handling config file with missing keys."""
         # Create config with only some keys
         partial_config = {"default_format": "JPEG"}
-        with open(temp_config_file, "w") as f:
-            json.dump(partial_config, f)
+        with open(temp_config_file, "wb") as f:
+            f.write(json.dumps(partial_config).encode())
 
         config = Config(temp_config_file)
         assert config.default_format == "JPEG"
@@ -135,3 +145,175 @@ class TestConfig:
         config = Config(temp_config_file)
         repr_str = repr(config)
         assert "Config" in repr_str
+
+    def test_shared_reuses_instance(self, temp_config_file):
+        """Test Config.shared returns one instance per file path."""
+        config = Config.shared(temp_config_file)
+        assert Config.shared(str(temp_config_file)) is config
+        assert Config.shared() is not config
+
+    def test_default_path_is_isolated(self, isolated_default_config):
+        """Test the default config location is redirected during tests."""
+        assert Config().config_file == Path(isolated_default_config)
+
+    def test_save_is_atomic(self, temp_config_file):
+        """Test save replaces the file and leaves no temporary behind."""
+        config = Config(temp_config_file)
+        config.default_format = "WEBP"
+        config.save()
+
+        assert json.loads(temp_config_file.read_bytes())["default_format"] == "WEBP"
+        assert list(temp_config_file.parent.iterdir()) == [temp_config_file]
+
+    def test_failed_save_leaves_no_temporary(self, temp_config_file, monkeypatch):
+        """Test a failed write removes the temporary and keeps the old file."""
+        config = Config(temp_config_file)
+        config.save()
+        original = temp_config_file.read_bytes()
+
+        def broken_dumps(data):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("screenshot_capturer.config._dumps", broken_dumps)
+        config.default_format = "WEBP"
+        with pytest.raises(OSError):
+            config.save()
+
+        assert temp_config_file.read_bytes() == original
+        assert list(temp_config_file.parent.iterdir()) == [temp_config_file]
+
+    def test_save_keeps_symlink(self, tmp_path):
+        """Test saving through a symlink updates the target, not the link."""
+        target = tmp_path / "real" / "config.json"
+        target.parent.mkdir()
+        target.write_text("{}")
+        link = tmp_path / "config.json"
+        try:
+            link.symlink_to(target)
+        except (OSError, NotImplementedError):
+            pytest.skip("symlinks are not supported here")
+
+        config = Config(link)
+        config.default_format = "WEBP"
+        config.save()
+
+        assert link.is_symlink()
+        assert json.loads(target.read_bytes())["default_format"] == "WEBP"
+        assert list(target.parent.iterdir()) == [target]
+
+    def test_dirty_tracks_changes(self, temp_config_file):
+        """Test only real changes mark the configuration dirty."""
+        config = Config(temp_config_file)
+        config.default_format = "png"
+        assert not config.dirty
+
+        config.default_format = "jpeg"
+        assert config.dirty
+
+        config.save()
+        assert not config.dirty
+
+    def test_config_has_no_instance_dict(self, temp_config_file):
+        """Test Config uses slots instead of a per-instance __dict__."""
+        config = Config(temp_config_file)
+        assert not hasattr(config, "__dict__")
+        with pytest.raises(AttributeError):
+            config.unknown_attribute = 1
+
+    def test_parse_cache_reused_until_file_changes(self, temp_config_file, monkeypatch):
+        """Test unchanged files are parsed once and edits are picked up."""
+        from screenshot_capturer import config as config_module
+
+        Config(temp_config_file).save()
+        parsed = []
+        real_loads = config_module._loads
+
+        def counting_loads(data):
+            parsed.append(data)
+            return real_loads(data)
+
+        monkeypatch.setattr(config_module, "_loads", counting_loads)
+        assert Config(temp_config_file).default_format == "PNG"
+        assert parsed == []
+
+        with open(temp_config_file, "wb") as f:
+            f.write(
+                json.dumps({"default_format": "JPEG", "default_quality": 80}).encode()
+            )
+        assert Config(temp_config_file).default_format == "JPEG"
+        assert len(parsed) == 1
+
+    def test_load_large_file_via_mmap(self, temp_config_file, monkeypatch):
+        """Test files above the mmap threshold load the same values."""
+        from screenshot_capturer import config as config_module
+
+        if config_module._MMAP_THRESHOLD is None:
+            pytest.skip("mmap loading requires orjson")
+        monkeypatch.setattr(config_module, "_MMAP_THRESHOLD", 1)
+
+        with open(temp_config_file, "wb") as f:
+            f.write(
+                json.dumps({"default_format": "BMP", "default_quality": 70}).encode()
+            )
+
+        config = Config(temp_config_file)
+        assert config.default_format == "BMP"
+        assert config.default_quality == 70
+
+    def test_default_output_dir_shared(self, temp_config_file):
+        """Test the default output directory Path is built once."""
+        config = Config(temp_config_file)
+        assert config.default_output_dir is Config(temp_config_file).default_output_dir
+
+    def test_mistyped_values_use_defaults(self, temp_config_file):
+        """Test values of the wrong type fall back to their defaults."""
+        with open(temp_config_file, "wb") as f:
+            f.write(
+                json.dumps({"default_format": 5, "default_quality": "high"}).encode()
+            )
+
+        config = Config(temp_config_file)
+        assert config.default_format == "PNG"
+        assert config.default_quality == 95
+
+    def test_non_object_config_uses_defaults(self, temp_config_file):
+        """Test a JSON document that is not an object falls back to defaults."""
+        with open(temp_config_file, "wb") as f:
+            f.write(b"[1, 2, 3]")
+
+        config = Config(temp_config_file)
+        assert config.default_format == "PNG"
+
+    def test_bool_quality_uses_default(self, temp_config_file):
+        """Test a boolean quality in the file is rejected on load."""
+        with open(temp_config_file, "wb") as f:
+            f.write(json.dumps({"default_quality": True}).encode())
+
+        assert Config(temp_config_file).default_quality == 95
+
+    def test_out_of_range_quality_uses_default(self, temp_config_file):
+        """Test an out-of-range quality in the file is rejected on load."""
+        with open(temp_config_file, "wb") as f:
+            f.write(json.dumps({"default_quality": 500}).encode())
+
+        assert Config(temp_config_file).default_quality == 95
+
+    def test_unsupported_format_uses_default(self, temp_config_file):
+        """Test an unsupported format in the file is rejected on load."""
+        with open(temp_config_file, "wb") as f:
+            f.write(json.dumps({"default_format": "XYZ"}).encode())
+
+        assert Config(temp_config_file).default_format == "PNG"
+
+    def test_loaded_format_is_normalized(self, temp_config_file):
+        """Test a hand-edited lower-case format loads in canonical form."""
+        with open(temp_config_file, "wb") as f:
+            f.write(json.dumps({"default_format": "jpeg"}).encode())
+
+        assert Config(temp_config_file).default_format == "JPEG"
+
+    def test_bool_quality_setter_rejected(self, temp_config_file):
+        """Test the quality setter rejects booleans."""
+        config = Config(temp_config_file)
+        with pytest.raises(ValueError):
+            config.default_quality = True
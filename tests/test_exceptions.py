@@ -30,6 +30,19 @@ class TestExceptions:
         assert error.platform == "AmigaOS"
         assert isinstance(error, ScreenshotCapturerError)
 
+    def test_platform_stored_in_slot(self):
+        """Test PlatformNotSupportedError keeps platform out of __dict__."""
+        error = PlatformNotSupportedError("AmigaOS")
+        assert "platform" not in vars(error)
+
+    def test_platform_error_pickles(self):
+        """Test PlatformNotSupportedError survives a pickle round trip."""
+        import pickle
+
+        error = pickle.loads(pickle.dumps(PlatformNotSupportedError("AmigaOS")))
+        assert error.platform == "AmigaOS"
+        assert str(error) == "Platform 'AmigaOS' is not supported"
+
     def test_capture_failed_error(self):
         """Test CaptureFailedError."""
         error = CaptureFailedError("Capture failed")
@@ -50,12 +63,12 @@ class TestExceptions:
 
     def test_exception_inheritance(self):
         """Test that all exceptions inherit from base."""
-        exceptions = [
+        exceptions = (
             PlatformNotSupportedError("test"),
             CaptureFailedError("test"),
             InvalidRegionError("test"),
             SaveError("test"),
-        ]
+        )
 
         for exc in exceptions:
             assert isinstance(exc, ScreenshotCapturerError)